@@ -28,6 +28,7 @@
     topo_sort_backward,
     topo_sort_forward_bfs,
     topo_sort_forward_dfs,
+    topo_sort_forward_memory_dfs,
 )
 from propdag.template2 import (
     T2Argument,
@@ -40,6 +41,7 @@
     reverse_dag,
     topo_sort_forward_bfs_t2,
     topo_sort_forward_dfs_t2,
+    topo_sort_forward_hybrid_t2,
 )
 from propdag.toy import (
     BackwardToyNode,
@@ -86,4 +88,6 @@
     "topo_sort_forward_bfs_t2",
     "topo_sort_forward_dfs",
     "topo_sort_forward_dfs_t2",
+    "topo_sort_forward_hybrid_t2",
+    "topo_sort_forward_memory_dfs",
 ]
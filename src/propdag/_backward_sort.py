@@ -0,0 +1,83 @@
+"""Backward topological sort helpers shared by template and template2."""
+
+__docformat__ = "restructuredtext"
+__all__ = [
+    "PreNodesType",
+    "SupportsPreNodes",
+    "merge_pre_sorts",
+    "topo_sort_backward_from",
+]
+
+from collections.abc import Sequence
+from typing import Any, Protocol, TypeVar
+
+from propdag._constants import CYCLE_ERROR_MSG
+
+
+class SupportsPreNodes(Protocol):
+    """Any node exposing its predecessors, e.g. ``TNode`` or ``T2Node``."""
+
+    @property
+    def pre_nodes(self) -> Sequence[Any]:
+        """Predecessor nodes."""
+        ...
+
+
+PreNodesType = TypeVar("PreNodesType", bound=SupportsPreNodes)
+
+
+def merge_pre_sorts(
+    node: PreNodesType, backward_sorts: dict[PreNodesType, list[PreNodesType]]
+) -> list[PreNodesType]:
+    """Build the backward sort of ``node`` from the sorts of its predecessors."""
+    pre_nodes = node.pre_nodes
+    if len(pre_nodes) == 1:
+        # Chains need neither a seen set nor a reversed copy.
+        return [node, *backward_sorts[pre_nodes[0]]]
+
+    # NOTE: Each predecessor's post-order is closed under its ancestors, so merging
+    # them in pre_nodes order while skipping seen nodes reproduces exactly the
+    # post-order a fresh DFS from this node would produce.
+    postorder: list[PreNodesType] = []
+    seen: set[PreNodesType] = set()
+    for pre_node in pre_nodes:
+        pre_sort = backward_sorts[pre_node]
+        if not postorder:
+            postorder.extend(reversed(pre_sort))
+            seen.update(pre_sort)
+            continue
+        for ancestor in reversed(pre_sort):
+            if ancestor not in seen:
+                seen.add(ancestor)
+                postorder.append(ancestor)
+    postorder.append(node)
+    return postorder[::-1]
+
+
+def topo_sort_backward_from(
+    node: PreNodesType, backward_sorts: dict[PreNodesType, list[PreNodesType]]
+) -> list[PreNodesType]:
+    """Return the backward sort of ``node``, reusing and filling ``backward_sorts``."""
+    backward_sort = backward_sorts.get(node)
+    if backward_sort is not None:
+        return backward_sort
+
+    # Explicit stack instead of recursion so deep graphs are not bounded by the
+    # interpreter's recursion limit. A node is merged once all its predecessors are.
+    expanding: set[PreNodesType] = set()
+    stack: list[tuple[PreNodesType, bool]] = [(node, False)]
+    while stack:
+        cur, expanded = stack.pop()
+        if cur in backward_sorts:
+            continue
+        if expanded:
+            expanding.discard(cur)
+            backward_sorts[cur] = merge_pre_sorts(cur, backward_sorts)
+            continue
+        if cur in expanding:
+            raise ValueError(CYCLE_ERROR_MSG)
+        expanding.add(cur)
+        stack.append((cur, True))
+        stack.extend((pre_node, False) for pre_node in cur.pre_nodes)
+
+    return backward_sorts[node]
@@ -3,6 +3,8 @@
 __docformat__ = "restructuredtext"
 __all__ = [
     "CYCLE_ERROR_MSG",
+    "DFS_DONE",
+    "DFS_IN_PROGRESS",
     "LOG_CACHE",
     "LOG_CLEAR",
     "LOG_COMPUTE",
@@ -18,6 +20,13 @@
 
 CYCLE_ERROR_MSG = "Graph has a cycle, cannot perform topological sort"
 
+# ---------------------------------------------------------------------------
+# DFS visit states; a node without an entry has not been reached yet
+# ---------------------------------------------------------------------------
+
+DFS_IN_PROGRESS = 1
+DFS_DONE = 2
+
 # ---------------------------------------------------------------------------
 # Log prefixes for toy/toy2 verbose output
 # ---------------------------------------------------------------------------
@@ -19,6 +19,7 @@
     topo_sort_backward,
     topo_sort_forward_bfs,
     topo_sort_forward_dfs,
+    topo_sort_forward_memory_dfs,
 )
 
 __all__ = [
@@ -31,4 +32,5 @@
     "topo_sort_backward",
     "topo_sort_forward_bfs",
     "topo_sort_forward_dfs",
+    "topo_sort_forward_memory_dfs",
 ]
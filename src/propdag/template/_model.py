@@ -10,7 +10,8 @@
 
 from abc import ABC
 from collections.abc import Sequence
-from typing import Literal
+from itertools import islice
+from typing import Any, Literal
 
 from propdag._enums import PropMode
 from propdag.custom_types import NodeType
@@ -20,6 +21,7 @@
     topo_sort_backward,
     topo_sort_forward_bfs,
     topo_sort_forward_dfs,
+    topo_sort_forward_memory_dfs,
 )
 
 
@@ -63,6 +65,32 @@ def clear_bwd_cache(cache_counter: dict[NodeType, int], nodes: Sequence[NodeType
                 del cache_counter[node]
 
 
+class _ReleaseRecorder:
+    """Stand-in node recording which positions the ``clear_*_cache`` helpers release."""
+
+    __slots__ = ("_index", "_released")
+
+    def __init__(self, index: int, released: list[int]):
+        """
+        Initialize a recorder for one node position.
+
+        :param index: Position of the recorded node.
+
+        :param released: Shared list the position is appended to when released.
+
+        """
+        self._index = index
+        self._released = released
+
+    def clear_fwd_cache(self):
+        """Record that the forward cache at this position is released."""
+        self._released.append(self._index)
+
+    def clear_bwd_cache(self):
+        """Record that the backward cache at this position is released."""
+        self._released.append(self._index)
+
+
 class TModel(ABC):
     """
     Template for computational graph model.
@@ -70,13 +98,36 @@ class TModel(ABC):
     This is a computation graph template. The overall logic is the whole graph and all
     nodes shares the same cache, their methods will operate on this cache. We do not
     consider subgraph, so there is no nested graphs.
+
+    Instance attributes live in ``__slots__``; subclasses should declare their own
+    ``__slots__`` (``()`` when they add no state) to stay free of ``__dict__``.
     """
 
-    _nodes: list[NodeType]
-    _sort_strategy: Literal["dfs", "bfs"]
+    __slots__ = (
+        "_all_backward_sorts",
+        "_arguments",
+        "_bwd_release_schedules",
+        "_cache",
+        "_fwd_release_schedule",
+        "_is_backward",
+        "_nodes",
+        "_offload_schedule",
+        "_restore_schedule",
+        "_sort_strategy",
+        "clear_cache_during_running",
+        "verbose",
+    )
+
+    _nodes: tuple[NodeType, ...]
+    _sort_strategy: Literal["dfs", "bfs", "memory_dfs"]
     _cache: TCache
     _arguments: TArgument
     _all_backward_sorts: dict[NodeType, list[NodeType]]
+    _fwd_release_schedule: list[tuple[int, ...]]
+    _is_backward: bool
+    _offload_schedule: list[tuple[int, ...]] | None
+    _restore_schedule: list[tuple[int, ...]] | None
+    _bwd_release_schedules: dict[NodeType, tuple[tuple[int, ...], ...]]
 
     verbose: bool
     clear_cache_during_running: bool
@@ -84,19 +135,26 @@ class TModel(ABC):
     def __init__(
         self,
         nodes: Sequence[NodeType],
-        sort_strategy: Literal["dfs", "bfs"] = "bfs",
+        sort_strategy: Literal["dfs", "bfs", "memory_dfs"] = "bfs",
         verbose: bool = False,
         clear_cache_during_running: bool = False,
+        offload_distance: int | None = None,
     ):
         """
         Initialize a computational graph model.
 
         :param nodes: Sequence of nodes to include in the model.
 
+        :param sort_strategy: Topological sort strategy (dfs, bfs or memory_dfs).
+
         :param verbose: Enable verbose output during execution.
 
         :param clear_cache_during_running: If True, clear forward and backward caches during execution.
 
+        :param offload_distance: If set, offload a node's forward cache after its step when its
+            first consumer runs more than this many steps later, and restore it right before
+            that consumer. None disables offloading.
+
         :raises AssertionError: If not all nodes share the same cache and arguments.
 
         """
@@ -104,16 +162,26 @@ def __init__(
         self.clear_cache_during_running = clear_cache_during_running
         self._sort_strategy = sort_strategy
         if sort_strategy == "dfs":
-            self._nodes = topo_sort_forward_dfs(nodes, self.verbose)
+            sorted_nodes = topo_sort_forward_dfs(nodes, self.verbose)
         elif sort_strategy == "bfs":
-            self._nodes = topo_sort_forward_bfs(nodes, self.verbose)
+            sorted_nodes = topo_sort_forward_bfs(nodes, self.verbose)
+        elif sort_strategy == "memory_dfs":
+            sorted_nodes = topo_sort_forward_memory_dfs(nodes, self.verbose)
         else:
             raise ValueError(f"Unknown sort strategy: {sort_strategy}")
+        # The order is fixed for the model's lifetime.
+        self._nodes = tuple(sorted_nodes)
+
+        # Collect the input/output nodes for validation in a single pass.
+        input_nodes = []
+        output_nodes = []
+        for node in self._nodes:
+            if len(node.pre_nodes) == 0:
+                input_nodes.append(node)
+            if len(node.next_nodes) == 0:
+                output_nodes.append(node)
 
         # Validate single input/output constraint
-        input_nodes = [node for node in self._nodes if len(node.pre_nodes) == 0]
-        output_nodes = [node for node in self._nodes if len(node.next_nodes) == 0]
-
         if len(input_nodes) == 0:
             raise ValueError(
                 "DAG must have exactly one input node, but found zero. "
@@ -137,12 +205,27 @@ def __init__(
 
         self._cache = nodes[0].cache
         self._arguments = nodes[0].argument
-        for node in nodes[1:]:
-            assert node.cache == self._cache
-            assert node.argument == self._arguments
+        for node in islice(nodes, 1, None):
+            assert node.cache is self._cache
+            assert node.argument is self._arguments
+        # The arguments are frozen, so the propagation mode is fixed for the model's lifetime.
+        # Compared by value once here: PropMode is an IntEnum, so a raw 2 also means BACKWARD.
+        self._is_backward = self._arguments.prop_mode == PropMode.BACKWARD
+
+        self._fwd_release_schedule = self._build_fwd_release_schedule()
+        if offload_distance is None:
+            self._offload_schedule = self._restore_schedule = None
+        else:
+            self._offload_schedule, self._restore_schedule = self._build_offload_schedules(
+                offload_distance
+            )
 
-        if self.arguments.prop_mode == PropMode.BACKWARD:
-            self._all_backward_sorts = topo_sort_backward(self.nodes, self.verbose)
+        # Backward sorts are only needed for back-substitution; subclasses index them by node.
+        if self._is_backward:
+            self._all_backward_sorts = topo_sort_backward(self._nodes, self.verbose)
+        else:
+            self._all_backward_sorts = {}
+        self._bwd_release_schedules = {}
 
     def run(self, *args, **kwargs):
         """
@@ -157,28 +240,49 @@ def run(self, *args, **kwargs):
         :param kwargs: Keyword arguments to pass to the model.
 
         """
-        cache_counter = {node: len(node.next_nodes) for node in self._nodes}
-
-        node = self.nodes[0]
-        if self.verbose:
+        # Bind loop invariants to locals once instead of re-reading attributes per node.
+        nodes = self._nodes
+        release_schedule = self._fwd_release_schedule
+        verbose = self.verbose
+        clear_cache = self.clear_cache_during_running
+        do_backsub = self._is_backward
+        backsub = self.backsub
+        offload_schedule = self._offload_schedule
+        restore_schedule = self._restore_schedule
+
+        # Iterate directly; the step index is only needed for the schedules.
+        nodes_iter = iter(nodes)
+        node = next(nodes_iter)
+        if verbose:
             print(f"Forward pass {node.name}")
         node.propagate()
         # No need to backward for the input node.
-
-        for i in range(1, len(self.nodes)):
-            node = self.nodes[i]
-            if self.verbose:
+        if offload_schedule is not None:
+            for j in offload_schedule[0]:
+                nodes[j].offload_fwd_cache()
+
+        for i, node in enumerate(nodes_iter, 1):
+            if restore_schedule is not None:
+                for j in restore_schedule[i]:
+                    nodes[j].restore_fwd_cache()
+            if verbose:
                 print(f"Forward pass {node.name}")
             node.propagate()
 
-            if self.arguments.prop_mode == PropMode.BACKWARD:
-                self.backsub(node)
+            if do_backsub:
+                backsub(node)
+
+            if clear_cache:
+                for j in release_schedule[i]:
+                    nodes[j].clear_fwd_cache()
 
-            if self.clear_cache_during_running:
-                clear_fwd_cache(cache_counter, node.pre_nodes)
+            if offload_schedule is not None:
+                for j in offload_schedule[i]:
+                    nodes[j].offload_fwd_cache()
 
-        if self.clear_cache_during_running:
-            clear_fwd_cache(cache_counter, [node])
+        if clear_cache:
+            for j in release_schedule[-1]:
+                nodes[j].clear_fwd_cache()
 
     def backsub(self, node: NodeType):
         """
@@ -196,38 +300,140 @@ def backsub(self, node: NodeType):
             # No need to do backward pass for the input node.
             return
 
-        cache_counter = {node: len(node.pre_nodes) for node in backward_sort}
+        verbose = self.verbose
+        if not self.clear_cache_during_running:
+            for sort_node in backward_sort:
+                if verbose:
+                    print(f"\tBack-substitute {sort_node.name}")
+                sort_node.backsub()
+            return
+
+        release_schedule = self._bwd_release_schedules.get(node)
+        if release_schedule is None:
+            release_schedule = self._build_bwd_release_schedule(backward_sort)
+            self._bwd_release_schedules[node] = release_schedule
+
+        # The schedule has one extra entry, so zip stops after the last node of the sort.
+        for sort_node, release in zip(backward_sort, release_schedule, strict=False):
+            if verbose:
+                print(f"\tBack-substitute {sort_node.name}")
+            sort_node.backsub()
+            for k in release:
+                backward_sort[k].clear_bwd_cache()
 
-        if self.verbose:
-            print(f"\tBack-substitute {node.name}")
-        node.backsub()
+        for k in release_schedule[-1]:
+            backward_sort[k].clear_bwd_cache()
 
-        for j in range(1, len(backward_sort)):
-            node = backward_sort[j]
-            if self.verbose:
-                print(f"\tBack-substitute {node.name}")
-            node.backsub()
-            if self.clear_cache_during_running:
-                clear_bwd_cache(cache_counter, node.next_nodes)
+    def _build_fwd_release_schedule(self) -> list[tuple[int, ...]]:
+        """
+        Precompute which forward caches run() releases after each step.
+
+        Replays ``clear_fwd_cache`` once over the fixed topological order with
+        recording stand-ins, so run() only visits the nodes actually released.
+        Entry ``i`` lists the positions released after node ``i`` propagates; the
+        extra last entry releases the output node once the pass is complete.
+
+        :return: List of ``len(nodes) + 1`` tuples of node positions.
+        """
+        nodes = self._nodes
+        released: list[int] = []
+        recorders: dict[NodeType, Any] = {
+            node: _ReleaseRecorder(i, released) for i, node in enumerate(nodes)
+        }
+        cache_counter: dict[Any, int] = {
+            recorder: len(node.next_nodes) for node, recorder in recorders.items()
+        }
+
+        schedule: list[tuple[int, ...]] = [()]  # The input node releases nothing.
+        for node in islice(nodes, 1, None):
+            clear_fwd_cache(cache_counter, [recorders[pre_node] for pre_node in node.pre_nodes])
+            # clear_fwd_cache visits a set, so order the positions for a stable schedule.
+            schedule.append(tuple(sorted(released)))
+            released.clear()
+        clear_fwd_cache(cache_counter, [recorders[nodes[-1]]])
+        schedule.append(tuple(released))
+        return schedule
+
+    def _build_offload_schedules(
+        self, offload_distance: int
+    ) -> tuple[list[tuple[int, ...]], list[tuple[int, ...]]]:
+        """
+        Precompute which forward caches run() offloads and restores at each step.
 
-        if self.clear_cache_during_running:
-            clear_bwd_cache(cache_counter, [node])
+        A node's forward cache is next read when its first consumer in the
+        topological order runs. Nodes whose first consumer is more than
+        ``offload_distance`` steps away are offloaded right after their own step and
+        restored right before that consumer's step.
+
+        :param offload_distance: Minimum gap, in steps, before a cache is offloaded.
+
+        :return: Offload and restore schedules, one tuple of node positions per step.
+        """
+        nodes = self._nodes
+        node_indices = {node: i for i, node in enumerate(nodes)}
+        offload: list[list[int]] = [[] for _ in nodes]
+        restore: list[list[int]] = [[] for _ in nodes]
+        for i, node in enumerate(nodes):
+            if len(node.next_nodes) == 0:
+                continue
+            first_use = min(node_indices[next_node] for next_node in node.next_nodes)
+            if first_use - i > offload_distance:
+                offload[i].append(i)
+                restore[first_use].append(i)
+        return [tuple(step) for step in offload], [tuple(step) for step in restore]
+
+    @staticmethod
+    def _build_bwd_release_schedule(
+        backward_sort: list[NodeType],
+    ) -> tuple[tuple[int, ...], ...]:
+        """
+        Precompute which backward caches backsub() releases after each step.
+
+        Replays ``clear_bwd_cache`` once over a fixed backward sort with recording
+        stand-ins. Entry ``j`` lists the positions released after
+        ``backward_sort[j]`` back-substitutes; the extra last entry releases the
+        input node once the pass is complete.
+
+        :param backward_sort: Backward topological sort of one back-substitution.
+
+        :return: Tuple of ``len(backward_sort) + 1`` tuples of positions in the sort.
+        """
+        released: list[int] = []
+        recorders: dict[NodeType, Any] = {
+            sort_node: _ReleaseRecorder(j, released) for j, sort_node in enumerate(backward_sort)
+        }
+        cache_counter: dict[Any, int] = {
+            recorder: len(sort_node.pre_nodes) for sort_node, recorder in recorders.items()
+        }
+
+        schedule: list[tuple[int, ...]] = [()]  # The first node releases nothing.
+        for sort_node in islice(backward_sort, 1, None):
+            # Next nodes outside the sort stay as themselves and are skipped by clear_bwd_cache.
+            clear_bwd_cache(
+                cache_counter,
+                [recorders.get(next_node, next_node) for next_node in sort_node.next_nodes],
+            )
+            schedule.append(tuple(released))
+            released.clear()
+        clear_bwd_cache(cache_counter, [recorders[backward_sort[-1]]])
+        schedule.append(tuple(released))
+        return tuple(schedule)
 
     @property
     def sort_strategy(self):
         """
         Get the sorting strategy used in the model.
 
-        :return: Sorting strategy (either 'dfs' or 'bfs').
+        :return: Sorting strategy ('dfs', 'bfs' or 'memory_dfs').
         """
         return self._sort_strategy
 
     @property
-    def nodes(self) -> list[NodeType]:
+    def nodes(self) -> tuple[NodeType, ...]:
         """
         Get the nodes in the model.
 
-        :return: Topologically sorted list of nodes.
+        :return: Topologically sorted tuple of nodes.
         """
         return self._nodes
 
@@ -28,8 +28,19 @@ class TNode(ABC, Generic[CacheType, ArgumentType]):
     - Input nodes: no predecessors, bounds provided externally
     - Hidden nodes: have predecessors and successors
     - Output nodes: no successors, final bounds computed here
+
+    Instance attributes live in ``__slots__``; subclasses should declare their own
+    ``__slots__`` (``()`` when they add no state) to stay free of ``__dict__``.
     """
 
+    __slots__ = (
+        "_argument",
+        "_cache",
+        "_name",
+        "_next_nodes",
+        "_pre_nodes",
+    )
+
     _name: str
     _cache: CacheType
     _argument: ArgumentType
@@ -101,6 +112,25 @@ def clear_bwd_cache(self) -> None:
         """
         raise RuntimeError(f"This method should be instantiated in {type(self).__name__}.")
 
+    def offload_fwd_cache(self) -> None:
+        """
+        Move forward computation cache out of fast memory.
+
+        Called by ``TModel`` when the model is built with ``offload_distance`` and
+        this node's cache will not be read for a while, e.g. to move tensors to host
+        memory. The default does nothing.
+
+        """
+
+    def restore_fwd_cache(self) -> None:
+        """
+        Bring an offloaded forward computation cache back.
+
+        Called by ``TModel`` right before the step that next reads the cache
+        offloaded by ``offload_fwd_cache``. The default does nothing.
+
+        """
+
     def init_symbnd(self) -> None:
         """
         Initialize symbolic bounds.
@@ -1,11 +1,18 @@
 """Topological sorting algorithms for computational graph traversal."""
 
 __docformat__ = "restructuredtext"
-__all__ = ["topo_sort_backward", "topo_sort_forward_bfs", "topo_sort_forward_dfs"]
-
+__all__ = [
+    "topo_sort_backward",
+    "topo_sort_forward_bfs",
+    "topo_sort_forward_dfs",
+    "topo_sort_forward_memory_dfs",
+]
+
+from collections import deque
 from collections.abc import Sequence
 
-from propdag._constants import CYCLE_ERROR_MSG
+from propdag._backward_sort import topo_sort_backward_from
+from propdag._constants import CYCLE_ERROR_MSG, DFS_DONE, DFS_IN_PROGRESS
 from propdag.custom_types import NodeType
 
 
@@ -50,24 +57,30 @@ def topo_sort_forward_dfs(nodes: Sequence[NodeType], verbose: bool = False) -> l
     """
     _check_input_output_number(nodes, verbose)
 
-    visited = set()
-    temp_mark = set()
-    sorted_nodes = []
-
-    def dfs(node):
-        if node in temp_mark:
-            raise ValueError(CYCLE_ERROR_MSG)
-        if node not in visited:
-            temp_mark.add(node)
-            for next_node in node.next_nodes:
-                dfs(next_node)
-            temp_mark.remove(node)
-            visited.add(node)
-            sorted_nodes.append(node)
+    state: dict[NodeType, int] = {}
+    sorted_nodes: list[NodeType] = []
 
-    for node in nodes:
-        if len(node.pre_nodes) == 0:
-            dfs(node)
+    # Explicit stack of (node, remaining successors) instead of recursion so deep
+    # graphs are not bounded by the interpreter's recursion limit.
+    for root in nodes:
+        if len(root.pre_nodes) != 0 or root in state:
+            continue
+        state[root] = DFS_IN_PROGRESS
+        stack = [(root, iter(root.next_nodes))]
+        while stack:
+            node, successors = stack[-1]
+            for next_node in successors:
+                next_state = state.get(next_node)
+                if next_state is None:
+                    state[next_node] = DFS_IN_PROGRESS
+                    stack.append((next_node, iter(next_node.next_nodes)))
+                    break
+                if next_state == DFS_IN_PROGRESS:
+                    raise ValueError(CYCLE_ERROR_MSG)
+            else:
+                stack.pop()
+                state[node] = DFS_DONE
+                sorted_nodes.append(node)
 
     if len(sorted_nodes) != len(nodes):
         raise ValueError(CYCLE_ERROR_MSG)
@@ -98,10 +111,10 @@ def topo_sort_forward_bfs(nodes: Sequence[NodeType], verbose: bool = False) -> l
     # the same input appears twice in pre_nodes
     in_degrees: dict[NodeType, int] = {node: len(set(node.pre_nodes)) for node in nodes}
 
-    queue: list[NodeType] = [node for node in nodes if in_degrees[node] == 0]
+    queue: deque[NodeType] = deque(node for node in nodes if in_degrees[node] == 0)
     sorted_nodes: list[NodeType] = []
     while queue:
-        node = queue.pop(0)
+        node = queue.popleft()
         sorted_nodes.append(node)
         for next_node in node.next_nodes:
             in_degrees[next_node] -= 1
@@ -114,6 +127,54 @@ def topo_sort_forward_bfs(nodes: Sequence[NodeType], verbose: bool = False) -> l
     return sorted_nodes
 
 
+def topo_sort_forward_memory_dfs(
+    nodes: Sequence[NodeType], verbose: bool = False
+) -> list[NodeType]:
+    """
+    Perform a memory-oriented DFS for topological sort of nodes.
+
+    This orders the nodes by a post-order DFS over ``pre_nodes`` starting from the
+    output nodes, so each node is scheduled right before its first consumer needs it
+    and its forward cache can be released sooner.
+
+    :param nodes: Sequence of nodes to sort.
+
+    :param verbose: Whether to print diagnostics.
+
+    :return: Topologically sorted list of nodes
+    :raises ValueError: If the graph contains a cycle.
+
+    """
+    _check_input_output_number(nodes, verbose)
+
+    state: dict[NodeType, int] = {}
+    postorder: list[NodeType] = []
+    for output_node in nodes:
+        if len(output_node.next_nodes) != 0:
+            continue
+        stack: list[tuple[NodeType, bool]] = [(output_node, False)]
+        while stack:
+            node, expanded = stack.pop()
+            node_state = state.get(node)
+            if node_state == DFS_DONE:
+                continue
+            if expanded:
+                state[node] = DFS_DONE
+                postorder.append(node)
+                continue
+            if node_state == DFS_IN_PROGRESS:
+                raise ValueError(CYCLE_ERROR_MSG)
+            state[node] = DFS_IN_PROGRESS
+            stack.append((node, True))
+            # Reversed so that predecessors are visited in pre_nodes order.
+            stack.extend((pre_node, False) for pre_node in reversed(node.pre_nodes))
+
+    if len(postorder) != len(nodes):
+        raise ValueError(CYCLE_ERROR_MSG)
+
+    return postorder
+
+
 def topo_sort_backward(
     nodes: Sequence[NodeType], verbose: bool = False
 ) -> dict[NodeType, list[NodeType]]:
@@ -121,37 +182,19 @@ def topo_sort_backward(
     Generate backward topological sorts for each node.
 
     For each node, computes a topological sort of all nodes required
-    for back-substitution from that node.
-    Here, the DFS (Depth-First Search) algorithm is used to traverse the graph.
+    for back-substitution from that node. The order matches a DFS over
+    ``pre_nodes``, but each node's sort is assembled from the sorts of its
+    predecessors instead of re-walking all of its ancestors.
 
     :param nodes: Sequence of nodes in the computational graph.
 
     :param verbose: Whether to print diagnostics.
 
     :return: Dictionary mapping each node to its backward topological sort
+    :raises ValueError: If the graph contains a cycle.
     """
-
-    def dfs(node, visited, result):
-        if node in visited:
-            return
-        visited.add(node)
-        for pre_node in node.pre_nodes:
-            dfs(pre_node, visited, result)
-        result.append(node)  # post-order, ensures pre_node comes before node
-
-    backward_sorts = {}
+    backward_sorts: dict[NodeType, list[NodeType]] = {}
     for node in nodes:
-        visited: set[NodeType] = set()
-        result: list[NodeType] = []
-        dfs(node, visited, result)
-        backward_sorts[node] = result  # already in correct topological order
-
-    for node, backward_sort in backward_sorts.items():
-        backward_sorts[node] = backward_sort[::-1]  # reverse to get the correct order
-
-    # THE FOLLOWING IS FOR DEBUGGING PURPOSES
-    # for node, backward_sort in backward_sorts.items():
-    #     print(node)
-    #     print([n.name for n in backward_sort])
+        topo_sort_backward_from(node, backward_sorts)
 
-    return backward_sorts
+    return {node: backward_sorts[node] for node in nodes}
@@ -46,7 +46,8 @@
 - T2Node: Abstract node base class for reversed graph
 - clear_bwd_cache_t2: Cache clearing utility for template2
 - reverse_dag: Helper function to reverse graph edges
-- topo_sort_forward_bfs_t2/topo_sort_forward_dfs_t2: Topological sorting for reversed graphs
+- topo_sort_forward_bfs_t2/topo_sort_forward_dfs_t2/topo_sort_forward_hybrid_t2: Topological
+  sorting for reversed graphs
 """
 
 __docformat__ = "restructuredtext"
@@ -55,7 +56,11 @@
 from propdag.template2._cache import T2Cache
 from propdag.template2._model import T2Model, clear_bwd_cache_t2, reverse_dag
 from propdag.template2._node import T2ArgumentType, T2CacheType, T2Node
-from propdag.template2._sort import topo_sort_forward_bfs_t2, topo_sort_forward_dfs_t2
+from propdag.template2._sort import (
+    topo_sort_forward_bfs_t2,
+    topo_sort_forward_dfs_t2,
+    topo_sort_forward_hybrid_t2,
+)
 
 __all__ = [
     "T2Argument",
@@ -68,4 +73,5 @@
     "reverse_dag",
     "topo_sort_forward_bfs_t2",
     "topo_sort_forward_dfs_t2",
+    "topo_sort_forward_hybrid_t2",
 ]
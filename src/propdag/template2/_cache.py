@@ -3,7 +3,6 @@
 __docformat__ = "restructuredtext"
 __all__ = ["T2Cache"]
 
-from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -42,7 +41,7 @@ class T2Cache:
     """
 
     cur_node: "T2Node | None" = None
-    bnds: dict[str, tuple] = field(default_factory=OrderedDict)
-    rlxs: dict[str, tuple] = field(default_factory=OrderedDict)
-    fwd_bnds: dict[str, tuple] = field(default_factory=OrderedDict)
-    symbnds: dict[str, tuple] = field(default_factory=OrderedDict)
+    bnds: dict[str, tuple] = field(default_factory=dict)
+    rlxs: dict[str, tuple] = field(default_factory=dict)
+    fwd_bnds: dict[str, tuple] = field(default_factory=dict)
+    symbnds: dict[str, tuple] = field(default_factory=dict)
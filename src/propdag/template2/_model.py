@@ -17,6 +17,7 @@
     topo_sort_backward_t2,
     topo_sort_forward_bfs_t2,
     topo_sort_forward_dfs_t2,
+    topo_sort_forward_hybrid_t2,
 )
 
 if TYPE_CHECKING:
@@ -40,9 +41,14 @@ def reverse_dag(user_nodes: Sequence["T2Node"], verbose: bool = False) -> tuple[
     :raises ValueError: If graph doesn't have exactly one input and one output.
 
     """
-    # STEP 1: Validate user's forward graph (BEFORE reversal)
-    user_input_nodes = [n for n in user_nodes if len(n.pre_nodes) == 0]
-    user_output_nodes = [n for n in user_nodes if len(n.next_nodes) == 0]
+    # STEP 1: Validate user's forward graph (BEFORE reversal), in a single scan
+    user_input_nodes = []
+    user_output_nodes = []
+    for n in user_nodes:
+        if len(n.pre_nodes) == 0:
+            user_input_nodes.append(n)
+        if len(n.next_nodes) == 0:
+            user_output_nodes.append(n)
 
     if len(user_input_nodes) == 0:
         raise ValueError(
@@ -93,7 +99,9 @@ def clear_bwd_cache_t2(cache_counter: dict["T2Node", int], nodes: Sequence["T2No
     :param nodes: List of nodes whose cache counters to decrement.
 
     """
-    for node in set(nodes):  # Use set to handle duplicate nodes
+    # Duplicates (e.g. x * x) count once. dict.fromkeys keeps the clearing order
+    # deterministic, and the common single-node case skips building it at all.
+    for node in nodes if len(nodes) < 2 else dict.fromkeys(nodes):
         cache_counter[node] -= 1
         if cache_counter[node] <= 0:  # The output node (user's input) will be -1
             node.clear_bwd_cache()
@@ -125,20 +133,22 @@ class T2Model(ABC):
     - All nodes must share same cache and arguments
 
     :ivar _nodes: Topologically sorted nodes (Output -> Input after reversal)
-    :ivar _sort_strategy: Sorting strategy used (dfs or bfs)
+    :ivar _sort_strategy: Sorting strategy used (dfs, bfs or hybrid)
     :ivar _cache: Shared cache across all nodes
     :ivar _arguments: Shared arguments across all nodes
+    :ivar _init_cache_counter: Per-node next-node counts that run() starts cache clearing from
     :ivar verbose: Whether to print execution diagnostics
     :ivar clear_cache_during_running: Whether to clear caches during execution
     """
 
     _nodes: list["T2Node"]
-    _sort_strategy: Literal["dfs", "bfs"]
+    _sort_strategy: Literal["dfs", "bfs", "hybrid"]
     _cache: T2Cache
     _arguments: T2Argument
     _user_input: "T2Node"
     _user_output: "T2Node"
     _all_backward_sorts: dict["T2Node", list["T2Node"]]
+    _init_cache_counter: dict["T2Node", int]
 
     verbose: bool
     clear_cache_during_running: bool
@@ -146,7 +156,7 @@ class T2Model(ABC):
     def __init__(
         self,
         user_nodes: Sequence["T2Node"],
-        sort_strategy: Literal["dfs", "bfs"] = "bfs",
+        sort_strategy: Literal["dfs", "bfs", "hybrid"] = "bfs",
         verbose: bool = False,
         clear_cache_during_running: bool = False,
     ):
@@ -163,7 +173,7 @@ def __init__(
 
         :param user_nodes: Nodes in user's forward graph (Input -> Output).
 
-        :param sort_strategy: Topological sort strategy (dfs or bfs).
+        :param sort_strategy: Topological sort strategy (dfs, bfs or hybrid).
 
         :param verbose: Enable verbose output during execution.
 
@@ -189,6 +199,8 @@ def __init__(
             self._nodes = topo_sort_forward_dfs_t2(list(user_nodes), self.verbose)
         elif sort_strategy == "bfs":
             self._nodes = topo_sort_forward_bfs_t2(list(user_nodes), self.verbose)
+        elif sort_strategy == "hybrid":
+            self._nodes = topo_sort_forward_hybrid_t2(list(user_nodes), self.verbose)
         else:
             raise ValueError(f"Unknown sort strategy: {sort_strategy}")
 
@@ -209,13 +221,17 @@ def __init__(
         self._cache = user_nodes[0].cache
         self._arguments = user_nodes[0].argument
         for node in user_nodes[1:]:
-            assert node.cache == self._cache, "All nodes must share same cache"
-            assert node.argument == self._arguments, "All nodes must share same arguments"
+            assert node.cache is self._cache, "All nodes must share same cache"
+            assert node.argument is self._arguments, "All nodes must share same arguments"
 
         # Compute backward sorts for backsub (from each node back to Output/graph input)
         # In the reversed graph, pre_nodes point toward the graph input (user's output)
         self._all_backward_sorts = topo_sort_backward_t2(self._nodes, self.verbose)
 
+        # The graph is fixed from here on, so the initial counts are computed once and
+        # copied by each run instead of re-measuring every node's next_nodes.
+        self._init_cache_counter = {node: len(node.next_nodes) for node in self._nodes}
+
     def run(self, *args, **kwargs):
         """
         Execute backward bound propagation via forward traversal.
@@ -237,29 +253,33 @@ def run(self, *args, **kwargs):
         :param kwargs: Keyword arguments (unused, for future extensions).
 
         """
-        cache_counter = {node: len(node.next_nodes) for node in self._nodes}
+        # Bind loop invariants to locals once instead of re-reading attributes per node.
+        nodes = self._nodes
+        verbose = self.verbose
+        clear_cache = self.clear_cache_during_running
+        cache_counter = self._init_cache_counter.copy()
 
         # Process all nodes in topological order (Output -> Input in user's view)
-        for i, node in enumerate(self._nodes):
-            if self.verbose:
+        for node in nodes:
+            if verbose:
                 print(f"Propagate bounds through {node.name}")
 
             node.rev_propagate()  # Actually does backward propagation!
 
-            # Clear predecessor caches when no longer needed
-            if self.clear_cache_during_running and i > 0:
+            # Clear predecessor caches when no longer needed (the first node has none)
+            if clear_cache:
                 clear_bwd_cache_t2(cache_counter, node.pre_nodes)
 
         # Clear final node cache
-        if self.clear_cache_during_running:
-            clear_bwd_cache_t2(cache_counter, [self._nodes[-1]])
+        if clear_cache:
+            clear_bwd_cache_t2(cache_counter, [nodes[-1]])
 
     @property
     def sort_strategy(self):
         """
         Get the sorting strategy used in the model.
 
-        :return: Sorting strategy (either 'dfs' or 'bfs').
+        :return: Sorting strategy ('dfs', 'bfs' or 'hybrid').
         """
         return self._sort_strategy
 
@@ -1,12 +1,19 @@
 """Topological sorting algorithms for reversed computational graphs."""
 
 __docformat__ = "restructuredtext"
-__all__ = ["topo_sort_backward_t2", "topo_sort_forward_bfs_t2", "topo_sort_forward_dfs_t2"]
-
+__all__ = [
+    "topo_sort_backward_t2",
+    "topo_sort_forward_bfs_t2",
+    "topo_sort_forward_dfs_t2",
+    "topo_sort_forward_hybrid_t2",
+]
+
+from collections import deque
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
-from propdag._constants import CYCLE_ERROR_MSG
+from propdag._backward_sort import topo_sort_backward_from
+from propdag._constants import CYCLE_ERROR_MSG, DFS_DONE, DFS_IN_PROGRESS
 
 if TYPE_CHECKING:
     from propdag.template2._node import T2Node
@@ -39,6 +46,18 @@ def _t2_check_input_output_number(nodes: Sequence["T2Node"], verbose: bool = Fal
         print(f"The reversed DAG has {n_inputs} inputs and {n_outputs} outputs.")
 
 
+def _unique_in_degrees_t2(nodes: Sequence["T2Node"]) -> dict["T2Node", int]:
+    """Count the unique ``pre_nodes`` of each node for Kahn's algorithm."""
+    # Use unique pre_nodes count to handle cases like x * x where
+    # the same input appears twice in pre_nodes. Only a node with two or more
+    # pre_nodes can repeat one, so the set is skipped for the rest.
+    in_degrees: dict[T2Node, int] = {}
+    for node in nodes:
+        pre_nodes = node.pre_nodes
+        in_degrees[node] = len(pre_nodes) if len(pre_nodes) < 2 else len(set(pre_nodes))
+    return in_degrees
+
+
 def topo_sort_forward_dfs_t2(nodes: Sequence["T2Node"], verbose: bool = False) -> list["T2Node"]:
     """
     Perform DFS topological sort on reversed graph.
@@ -64,25 +83,31 @@ def topo_sort_forward_dfs_t2(nodes: Sequence["T2Node"], verbose: bool = False) -
     """
     _t2_check_input_output_number(nodes, verbose)
 
-    visited = set()
-    temp_mark = set()
-    sorted_nodes = []
-
-    def dfs(node):
-        if node in temp_mark:
-            raise ValueError(CYCLE_ERROR_MSG)
-        if node not in visited:
-            temp_mark.add(node)
-            for next_node in node.next_nodes:
-                dfs(next_node)
-            temp_mark.remove(node)
-            visited.add(node)
-            sorted_nodes.append(node)
-
-    # Start from nodes with no predecessors (user's output after reversal)
-    for node in nodes:
-        if len(node.pre_nodes) == 0:
-            dfs(node)
+    state: dict[T2Node, int] = {}
+    sorted_nodes: list[T2Node] = []
+
+    # Start from nodes with no predecessors (user's output after reversal). An explicit
+    # stack of (node, remaining successors) replaces recursion so deep graphs are not
+    # bounded by the interpreter's recursion limit.
+    for root in nodes:
+        if len(root.pre_nodes) != 0 or root in state:
+            continue
+        state[root] = DFS_IN_PROGRESS
+        stack = [(root, iter(root.next_nodes))]
+        while stack:
+            node, successors = stack[-1]
+            for next_node in successors:
+                next_state = state.get(next_node)
+                if next_state is None:
+                    state[next_node] = DFS_IN_PROGRESS
+                    stack.append((next_node, iter(next_node.next_nodes)))
+                    break
+                if next_state == DFS_IN_PROGRESS:
+                    raise ValueError(CYCLE_ERROR_MSG)
+            else:
+                stack.pop()
+                state[node] = DFS_DONE
+                sorted_nodes.append(node)
 
     if len(sorted_nodes) != len(nodes):
         raise ValueError(CYCLE_ERROR_MSG)
@@ -98,7 +123,9 @@ def topo_sort_backward_t2(
     Generate backward topological sorts for each node in reversed graph.
 
     For each node, computes a topological sort of all nodes required
-    for back-substitution from that node. Uses DFS traversal.
+    for back-substitution from that node. The order matches a DFS over
+    ``pre_nodes``, but each node's sort is assembled from the sorts of its
+    predecessors instead of re-walking all of its ancestors.
 
     In the reversed graph context, this traverses backward through pre_nodes
     which point toward the user's output (graph input).
@@ -108,27 +135,13 @@ def topo_sort_backward_t2(
     :param verbose: Whether to print diagnostics.
 
     :return: Dictionary mapping each node to its backward topological sort
+    :raises ValueError: If the graph contains a cycle.
     """
-
-    def dfs(node, visited, result):
-        if node in visited:
-            return
-        visited.add(node)
-        for pre_node in node.pre_nodes:
-            dfs(pre_node, visited, result)
-        result.append(node)  # post-order, ensures pre_node comes before node
-
     backward_sorts: dict[T2Node, list[T2Node]] = {}
     for node in nodes:
-        visited: set[T2Node] = set()
-        result: list[T2Node] = []
-        dfs(node, visited, result)
-        backward_sorts[node] = result  # already in correct topological order
-
-    for node, backward_sort in backward_sorts.items():
-        backward_sorts[node] = backward_sort[::-1]  # reverse to get correct order
+        topo_sort_backward_from(node, backward_sorts)
 
-    return backward_sorts
+    return {node: backward_sorts[node] for node in nodes}
 
 
 def topo_sort_forward_bfs_t2(nodes: Sequence["T2Node"], verbose: bool = False) -> list["T2Node"]:
@@ -155,16 +168,14 @@ def topo_sort_forward_bfs_t2(nodes: Sequence["T2Node"], verbose: bool = False) -
     """
     _t2_check_input_output_number(nodes, verbose)
 
-    # Use unique pre_nodes count to handle cases like x * x where
-    # the same input appears twice in pre_nodes
-    in_degrees: dict[T2Node, int] = {node: len(set(node.pre_nodes)) for node in nodes}
+    in_degrees = _unique_in_degrees_t2(nodes)
 
     # Start from nodes with in_degree 0 (user's output after reversal)
-    queue: list[T2Node] = [node for node in nodes if in_degrees[node] == 0]
+    queue: deque[T2Node] = deque(node for node in nodes if in_degrees[node] == 0)
     sorted_nodes: list[T2Node] = []
 
     while queue:
-        node = queue.pop(0)
+        node = queue.popleft()
         sorted_nodes.append(node)
         for next_node in node.next_nodes:
             in_degrees[next_node] -= 1
@@ -175,3 +186,52 @@ def topo_sort_forward_bfs_t2(nodes: Sequence["T2Node"], verbose: bool = False) -
         raise ValueError(CYCLE_ERROR_MSG)
 
     return sorted_nodes
+
+
+def topo_sort_forward_hybrid_t2(nodes: Sequence["T2Node"], verbose: bool = False) -> list["T2Node"]:
+    """
+    Perform a hybrid BFS/DFS topological sort on reversed graph.
+
+    Branches are scheduled breadth-first as in ``topo_sort_forward_bfs_t2``, but
+    when a node has a single successor that becomes ready, that successor runs
+    next. Linear chains (e.g. stacked activation layers) therefore stay
+    contiguous, so each node reads the bounds its predecessor has just written.
+
+    Example:
+        After reversal: Output -> A1 -> A2 -> A3 -> Input and Output -> B1 -> Input
+        BFS processes: [Output, A1, B1, A2, A3, Input]
+        Hybrid processes: [Output, A1, A2, A3, B1, Input]
+
+    :param nodes: Sequence of nodes in REVERSED graph.
+
+    :param verbose: Whether to print diagnostics.
+
+    :return: Topologically sorted list (Output -> Input in user's view)
+    :raises ValueError: If the graph contains a cycle.
+
+    """
+    _t2_check_input_output_number(nodes, verbose)
+
+    in_degrees = _unique_in_degrees_t2(nodes)
+
+    queue: deque[T2Node] = deque(node for node in nodes if in_degrees[node] == 0)
+    sorted_nodes: list[T2Node] = []
+
+    while queue:
+        node = queue.popleft()
+        sorted_nodes.append(node)
+        next_nodes = node.next_nodes
+        # Dive into a chain link instead of queueing it behind the other branches.
+        dive = len(next_nodes) == 1
+        for next_node in next_nodes:
+            in_degrees[next_node] -= 1
+            if in_degrees[next_node] == 0:
+                if dive:
+                    queue.appendleft(next_node)
+                else:
+                    queue.append(next_node)
+
+    if len(sorted_nodes) != len(nodes):
+        raise ValueError(CYCLE_ERROR_MSG)
+
+    return sorted_nodes
@@ -23,6 +23,8 @@ class BackwardToyNode(TNode[ToyCache, ToyArgument]):
     :ivar _next_nodes: List of successor nodes
     """
 
+    __slots__ = ()
+
     # Inherited from TNode[ToyCache, ToyArgument]
 
     def propagate(self):
@@ -3,7 +3,6 @@
 __docformat__ = "restructuredtext"
 __all__ = ["ToyCache"]
 
-from collections import OrderedDict
 from dataclasses import dataclass, field
 
 from propdag.template import TCache, TNode
@@ -24,6 +23,6 @@ class ToyCache(TCache):
     """
 
     cur_node: TNode | None = None
-    symbnds: dict[str, tuple] = field(default_factory=OrderedDict)
-    bnds: dict[str, tuple] = field(default_factory=OrderedDict)
-    rlxs: dict[str, tuple] = field(default_factory=OrderedDict)
+    symbnds: dict[str, tuple] = field(default_factory=dict)
+    bnds: dict[str, tuple] = field(default_factory=dict)
+    rlxs: dict[str, tuple] = field(default_factory=dict)
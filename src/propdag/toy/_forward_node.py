@@ -30,6 +30,8 @@ class ForwardToyNode(TNode[ToyCache, ToyArgument]):
     :ivar _next_nodes: Output nodes consuming this result
     """
 
+    __slots__ = ()
+
     # Inherited from TNode[ToyCache, ToyArgument]
 
     def propagate(self):
@@ -13,12 +13,14 @@ class ToyModel(TModel):
     This class demonstrates a simple implementation of the TModel abstract class with
     toy versions of cache and arguments.
 
-    :ivar _nodes: List of nodes in topological order
+    :ivar _nodes: Tuple of nodes in topological order
     :ivar _cache: Toy cache instance shared among all nodes
     :ivar _arguments: Toy arguments instance shared among all nodes
     :ivar _all_backward_sorts: Mapping of nodes to their backward topological sorts
     """
 
+    __slots__ = ()
+
     def run(self):
         """
         Execute the toy model with visible logging.
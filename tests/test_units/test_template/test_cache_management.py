@@ -277,6 +277,133 @@ def test_with_branching(self, clear):
         assert "Node-1" in cache.bnds, "Input should be preserved"
         assert "Node-4" in cache.bnds, "Output should be preserved"
 
+    @pytest.mark.parametrize("sort_strategy", ["bfs", "dfs"])
+    def test_backward_mode_releases_symbolic_bounds(self, sort_strategy):
+        """BACKWARD mode with clearing frees every symbolic bound after back-substitution."""
+        model, cache, _ = build_y_model(
+            sort_strategy=sort_strategy,
+            prop_mode=PropMode.BACKWARD,
+            clear_cache_during_running=True,
+        )
+        model.run()
+        assert set(cache.bnds) == {"Node-1", "Node-4"}, "only input/output bounds remain"
+        assert cache.symbnds == {}, "all symbolic bounds should be released"
+
+
+class TestForwardReleaseSchedule:
+    """``TModel`` precomputes after which step each forward cache is released."""
+
+    def test_diamond_releases_after_last_consumer(self):
+        """Each cache is released right after its last successor propagates."""
+        model, _, nodes = build_y_model()
+        assert model.nodes == tuple(nodes)
+        schedule = model._fwd_release_schedule  # noqa: SLF001
+        assert schedule == [(), (), (0,), (1, 2), (3,)]
+
+    def test_duplicate_predecessor_released_once(self):
+        """A predecessor listed twice (x * x) is only counted once."""
+        cache = ToyCache()
+        cache.bnds["Node-1"] = ("input bounds",)
+        arguments = ToyArgument(prop_mode=PropMode.FORWARD)
+        n1 = ForwardToyNode("Node-1", cache, arguments)
+        n2 = ForwardToyNode("Node-2", cache, arguments)
+        n1.next_nodes = [n2]
+        n2.pre_nodes = [n1, n1]
+        model = ToyModel([n1, n2])
+        assert model._fwd_release_schedule == [(), (0,), (1,)]  # noqa: SLF001
+
+
+class TestBackwardReleaseSchedule:
+    """``TModel`` precomputes per back-substitution when each backward cache is released."""
+
+    def test_diamond_sink_releases_after_all_predecessors(self, capsys):
+        """Each cache is released once every predecessor has back-substituted."""
+        model, _, nodes = build_y_model(
+            prop_mode=PropMode.BACKWARD, clear_cache_during_running=True
+        )
+        model.run()
+        capsys.readouterr()
+        sink = nodes[3]
+        assert [n.name for n in model._all_backward_sorts[sink]] == [  # noqa: SLF001
+            "Node-4",
+            "Node-3",
+            "Node-2",
+            "Node-1",
+        ]
+        assert model._bwd_release_schedules[sink] == ((), (), (0,), (2, 1), (3,))  # noqa: SLF001
+
+    def test_not_built_without_cache_clearing(self, capsys):
+        """Release schedules are only built when caches are cleared during running."""
+        model, _, _ = build_y_model(prop_mode=PropMode.BACKWARD)
+        model.run()
+        capsys.readouterr()
+        assert model._bwd_release_schedules == {}  # noqa: SLF001
+
+
+class _OffloadRecordingNode(ForwardToyNode):
+    """Forward toy node that records offload/restore calls into a shared list."""
+
+    events: list[str]
+
+    def offload_fwd_cache(self):
+        """Record the offload of this node's cache."""
+        self.events.append(f"offload {self.name}")
+
+    def restore_fwd_cache(self):
+        """Record the restore of this node's cache."""
+        self.events.append(f"restore {self.name}")
+
+    def propagate(self):
+        """Record the step, then propagate as usual."""
+        self.events.append(f"propagate {self.name}")
+        super().propagate()
+
+
+class TestForwardOffloadSchedule:
+    """``offload_distance`` offloads caches whose first consumer is far away."""
+
+    @staticmethod
+    def _build_wide_merge(offload_distance: int | None) -> tuple[ToyModel, list[str]]:
+        """Build Node-1 -> Node-2..Node-5 -> Node-6 with recording nodes."""
+        cache = ToyCache()
+        cache.bnds["Node-1"] = ("input bounds",)
+        arguments = ToyArgument(prop_mode=PropMode.FORWARD)
+        events: list[str] = []
+        nodes = [_OffloadRecordingNode(f"Node-{i}", cache, arguments) for i in range(1, 7)]
+        for node in nodes:
+            node.events = events
+        nodes[0].next_nodes = nodes[1:5]
+        for node in nodes[1:5]:
+            node.pre_nodes = [nodes[0]]
+            node.next_nodes = [nodes[5]]
+        nodes[5].pre_nodes = nodes[1:5]
+        return ToyModel(nodes, offload_distance=offload_distance), events
+
+    def test_disabled_by_default(self):
+        """Without ``offload_distance`` no hook is called."""
+        model, events = self._build_wide_merge(None)
+        model.run()
+        assert model._offload_schedule is None  # noqa: SLF001
+        assert all(event.startswith("propagate") for event in events)
+
+    def test_far_consumers_offload_and_restore_before_use(self, capsys):
+        """Caches are offloaded after their step and restored right before first use."""
+        model, events = self._build_wide_merge(2)
+        model.run()
+        capsys.readouterr()
+        assert events == [
+            "propagate Node-1",
+            "propagate Node-2",
+            "offload Node-2",
+            "propagate Node-3",
+            "offload Node-3",
+            "propagate Node-4",
+            "propagate Node-5",
+            "restore Node-2",
+            "restore Node-3",
+            "propagate Node-6",
+        ]
+
 
 class TestModuleLevelClearFunctions:
     """COV1/COV2: direct unit tests for ``clear_fwd_cache`` and ``clear_bwd_cache``."""
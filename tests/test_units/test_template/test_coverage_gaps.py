@@ -7,13 +7,14 @@
 3. Input node forward pass (skip behavior)
 4. Property getters (sort_strategy / cache / arguments)
 5. Cache clearing in verbose mode
+6. Slotted nodes and in-place edits of node lists
 """
 
 __docformat__ = "restructuredtext"
 
 import pytest
 
-from propdag import PropMode, ToyModel
+from propdag import PropMode, ToyArgument, ToyModel
 from test_template._helpers import build_chain_model
 
 
@@ -93,6 +94,56 @@ def test_arguments_property_identity(self):
         model, _, nodes = build_chain_model(3)
         assert model.arguments is nodes[0].argument
 
+    def test_nodes_property_is_immutable_order(self):
+        """``model.nodes`` is the sorted order frozen as a tuple."""
+        model, _, nodes = build_chain_model(3)
+        assert model.nodes == tuple(nodes)
+
+    def test_integer_prop_mode_selects_backward(self, capsys):
+        """An integer ``prop_mode`` equal to ``PropMode.BACKWARD`` enables back-substitution."""
+        _, _, nodes = build_chain_model(3, prop_mode=PropMode.BACKWARD)
+        arguments = ToyArgument(prop_mode=int(PropMode.BACKWARD))
+        for node in nodes:
+            node.argument = arguments
+        model = ToyModel(nodes, verbose=True)
+        model.run()
+        assert "Back-substitute" in capsys.readouterr().out
+
+    def test_model_uses_slots(self):
+        """``TModel`` and ``ToyModel`` keep instance state in slots, not ``__dict__``."""
+        model, _, _ = build_chain_model(3)
+        assert not hasattr(model, "__dict__")
+
+
+class TestNodeSlots:
+    """``TNode`` and the toy nodes keep their state in ``__slots__``."""
+
+    def test_node_base_uses_slots(self):
+        """A ``TNode`` subclass declaring empty ``__slots__`` carries no ``__dict__``."""
+        from propdag import TNode
+
+        class _SlottedNode(TNode):
+            __slots__ = ()
+
+        _, cache, _ = build_chain_model(2)
+        node = _SlottedNode("Node-X", cache, ToyArgument())
+        assert not hasattr(node, "__dict__")
+
+    def test_toy_nodes_use_slots(self):
+        """Toy nodes keep their state in the inherited slots, without ``__dict__``."""
+        _, _, nodes = build_chain_model(2)
+        _, _, backward_nodes = build_chain_model(2, prop_mode=PropMode.BACKWARD)
+        assert not hasattr(nodes[0], "__dict__")
+        assert not hasattr(backward_nodes[0], "__dict__")
+
+    def test_in_place_edits_are_seen_without_a_model(self, capsys):
+        """Toy nodes read their node lists directly, so in-place edits apply at once."""
+        _, cache, nodes = build_chain_model(2)
+        nodes[1].pre_nodes.clear()
+        cache.bnds["Node-2"] = ("input bounds",)
+        nodes[1].propagate()
+        assert "skip -> input_node" in capsys.readouterr().out
+
 
 class TestCacheClearingVerbose:
     """Cache clearing diagnostics in verbose mode."""
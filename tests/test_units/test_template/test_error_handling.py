@@ -7,13 +7,14 @@
 3. DAGs with cycles raise ValueError during topological sorting.
 4. Both BFS and DFS sort strategies detect the same constraint violations.
 5. Valid DAGs (chain / diamond / skip) construct without error.
+6. Nodes must share the same cache and argument objects, not merely equal ones.
 """
 
 __docformat__ = "restructuredtext"
 
 import pytest
 
-from propdag import ToyModel
+from propdag import PropMode, ToyArgument, ToyCache, ToyModel
 from test_template._helpers import (
     build_chain_model,
     build_cycle_nodes,
@@ -70,6 +71,26 @@ def test_both_strategies_detect_cycles(self, sort_strategy):
             ToyModel(nodes, sort_strategy=sort_strategy)
 
 
+class TestSharedState:
+    """All nodes must hold the very same cache and argument instances."""
+
+    def test_equal_but_distinct_cache_is_rejected(self):
+        """A node with its own (equal) cache object fails the identity check."""
+        _, _, nodes = build_chain_model(3)
+        nodes[2].cache = ToyCache(bnds=dict(nodes[0].cache.bnds))
+        assert nodes[2].cache == nodes[0].cache
+        with pytest.raises(AssertionError):
+            ToyModel(nodes)
+
+    def test_equal_but_distinct_argument_is_rejected(self):
+        """A node with its own (equal) argument object fails the identity check."""
+        _, _, nodes = build_chain_model(3)
+        nodes[1].argument = ToyArgument(prop_mode=PropMode.FORWARD)
+        assert nodes[1].argument == nodes[0].argument
+        with pytest.raises(AssertionError):
+            ToyModel(nodes)
+
+
 class TestValidDAGsAccepted:
     """Valid DAGs construct without error."""
 
@@ -7,10 +7,13 @@
 3. Both algorithms handle representative DAG topologies correctly.
 4. Edge cases like minimal and long chains work correctly.
 5. ``topo_sort_backward`` (previously uncovered) returns valid per-node sorts.
+6. ``topo_sort_forward_memory_dfs`` keeps no more forward caches alive than BFS.
 """
 
 __docformat__ = "restructuredtext"
 
+import sys
+
 import pytest
 from _helpers import verify_topological_order
 
@@ -19,10 +22,11 @@
     topo_sort_backward,
     topo_sort_forward_bfs,
     topo_sort_forward_dfs,
+    topo_sort_forward_memory_dfs,
 )
 from test_template._helpers import build_chain_model
 
-_FORWARD_SORTS = [topo_sort_forward_bfs, topo_sort_forward_dfs]
+_FORWARD_SORTS = [topo_sort_forward_bfs, topo_sort_forward_dfs, topo_sort_forward_memory_dfs]
 
 
 def _build_sort_topology_nodes(topology: str) -> list[ForwardToyNode]:
@@ -77,6 +81,23 @@ def _build_sort_topology_nodes(topology: str) -> list[ForwardToyNode]:
     raise ValueError(msg)
 
 
+def _peak_live_caches(sorted_nodes: list[ForwardToyNode]) -> int:
+    """Return the most forward caches alive at once when running nodes in this order.
+
+    A node's cache is alive from its own step until its last consumer has run.
+
+    :param sorted_nodes: topologically sorted nodes
+
+    :return: peak number of live forward caches
+    """
+    positions = {node: i for i, node in enumerate(sorted_nodes)}
+    last_use = [
+        max((positions[next_node] for next_node in node.next_nodes), default=i)
+        for i, node in enumerate(sorted_nodes)
+    ]
+    return max(sum(1 for j in range(i + 1) if last_use[j] >= i) for i in range(len(sorted_nodes)))
+
+
 class TestTopologicalSortValidity:
     """Topological sorts produce valid orders for representative topologies."""
 
@@ -132,7 +153,7 @@ def test_bfs_vs_dfs_may_differ_but_both_valid(self):
         for sort_func in _FORWARD_SORTS:
             verify_topological_order(sort_func(nodes, verbose=False))
 
-    @pytest.mark.parametrize("sort_strategy", ["bfs", "dfs"])
+    @pytest.mark.parametrize("sort_strategy", ["bfs", "dfs", "memory_dfs"])
     def test_model_works_with_both_sort_strategies(self, sort_strategy):
         """ToyModel runs to completion for both BFS and DFS on a diamond."""
         from test_template._helpers import build_diamond_model
@@ -164,6 +185,12 @@ def test_long_chain_maintains_order(self, length):
             for orig, ordered in zip(nodes, sorted_nodes, strict=True):
                 assert orig == ordered
 
+    @pytest.mark.parametrize("sort_func", _FORWARD_SORTS)
+    def test_deep_chain_does_not_hit_recursion_limit(self, sort_func):
+        """Chains deeper than the recursion limit are sorted iteratively."""
+        _, _, nodes = build_chain_model(sys.getrecursionlimit() + 100)
+        assert sort_func(nodes, verbose=False) == nodes
+
     def test_same_node_multiple_times_as_predecessor(self):
         """Duplicate predecessor entries do not break the topological sort."""
         cache = ToyCache()
@@ -185,6 +212,50 @@ def test_same_node_multiple_times_as_predecessor(self):
             assert position["Node-2"] < position["Node-3"]
 
 
+class TestMemoryDfsSort:
+    """``topo_sort_forward_memory_dfs`` orders nodes by their first consumer."""
+
+    def test_keeps_fewer_caches_alive_than_bfs(self):
+        """A side branch read only by the join runs late, so its cache is not held across ``b``."""
+        cache = ToyCache()
+        cache.bnds["x"] = ("input bounds",)
+        arguments = ToyArgument(prop_mode=PropMode.FORWARD)
+        x = ForwardToyNode("x", cache, arguments)
+        a = ForwardToyNode("a", cache, arguments)
+        b = ForwardToyNode("b", cache, arguments)
+        s = ForwardToyNode("s", cache, arguments)
+        out = ForwardToyNode("out", cache, arguments)
+        x.next_nodes = [a, b, s]
+        a.pre_nodes = [x]
+        a.next_nodes = [b]
+        b.pre_nodes = [a, x]
+        b.next_nodes = [out]
+        s.pre_nodes = [x]
+        s.next_nodes = [out]
+        out.pre_nodes = [b, s]
+        nodes = [x, a, b, s, out]
+
+        memory_order = topo_sort_forward_memory_dfs(nodes)
+        verify_topological_order(memory_order)
+        assert _peak_live_caches(memory_order) == 3
+        assert _peak_live_caches(topo_sort_forward_bfs(nodes)) == 4
+
+    def test_peak_never_exceeds_bfs(self):
+        """On the shared topologies the memory order never holds more caches than BFS."""
+        for topology in ("diamond", "skip_connection", "wide_merge"):
+            nodes = _build_sort_topology_nodes(topology)
+            memory_peak = _peak_live_caches(topo_sort_forward_memory_dfs(nodes))
+            assert memory_peak <= _peak_live_caches(topo_sort_forward_bfs(nodes)), topology
+
+    def test_cycle_raises_value_error(self):
+        """A cycle reachable from the output is rejected."""
+        _, _, nodes = build_chain_model(3)
+        nodes[0].pre_nodes = [nodes[1]]
+        nodes[1].next_nodes.append(nodes[0])
+        with pytest.raises(ValueError, match="cycle"):
+            topo_sort_forward_memory_dfs(nodes)
+
+
 class TestBackwardSort:
     """COV2: ``topo_sort_backward`` produces valid per-node backward sorts."""
 
@@ -207,3 +278,46 @@ def test_each_value_starts_with_target_and_lists_only_ancestors(self):
             assert ancestor_names == expected_ancestors, (
                 f"backward sort for {target.name} must contain only it plus its ancestors"
             )
+
+    def test_deep_chain_does_not_hit_recursion_limit(self):
+        """Backward sorts of very deep chains are built without recursion."""
+        length = sys.getrecursionlimit() + 100
+        _, _, nodes = build_chain_model(length)
+        result = topo_sort_backward(nodes, verbose=False)
+        assert result[nodes[-1]] == nodes[::-1]
+
+    def test_cycle_raises_value_error(self):
+        """A cycle reachable through ``pre_nodes`` is reported instead of looping."""
+        cache = ToyCache()
+        arguments = ToyArgument(prop_mode=PropMode.BACKWARD)
+        n1 = ForwardToyNode("Node-1", cache, arguments)
+        n2 = ForwardToyNode("Node-2", cache, arguments)
+        n1.pre_nodes = [n2]
+        n2.pre_nodes = [n1]
+        with pytest.raises(ValueError, match="cycle"):
+            topo_sort_backward([n1, n2], verbose=False)
+
+    def test_model_builds_backward_sorts_eagerly(self):
+        """``TModel`` fills ``_all_backward_sorts`` for every node at construction."""
+        model, _, nodes = build_chain_model(4, prop_mode=PropMode.BACKWARD)
+        expected = topo_sort_backward(nodes, verbose=False)
+        assert model._all_backward_sorts == expected  # noqa: SLF001
+
+    @pytest.mark.parametrize("topology", ["diamond", "skip_connection", "wide_merge"])
+    def test_matches_independent_dfs_per_node(self, topology):
+        """Sharing predecessor sorts yields the same order as a fresh DFS from each node."""
+
+        def dfs(node, visited, result):
+            if node in visited:
+                return
+            visited.add(node)
+            for pre_node in node.pre_nodes:
+                dfs(pre_node, visited, result)
+            result.append(node)
+
+        nodes = _build_sort_topology_nodes(topology)
+        result = topo_sort_backward(nodes, verbose=False)
+        for node in nodes:
+            postorder: list = []
+            dfs(node, set(), postorder)
+            assert result[node] == postorder[::-1]
@@ -14,10 +14,23 @@
 
 import pytest
 
-from propdag import Toy2Model
+from propdag import Toy2Argument, Toy2Cache, Toy2Model, Toy2Node, clear_bwd_cache_t2
 from test_template2._helpers import build_chain_model_t2
 
 
+class _ClearCountingNode(Toy2Node):
+    """Toy2Node that counts backward-cache releases instead of raising."""
+
+    def __init__(self, name, cache, argument):
+        """Create the node with a zero release count."""
+        super().__init__(name, cache, argument)
+        self.n_cleared = 0
+
+    def clear_bwd_cache(self):
+        """Count the release of this node's backward cache."""
+        self.n_cleared += 1
+
+
 class TestVerboseMode:
     """Verbose output during T2Model execution."""
 
@@ -95,6 +108,31 @@ def test_clear(self, clear):
         model, _, _ = build_chain_model_t2(2, clear_cache_during_running=clear)
         assert model.clear_cache_during_running is clear
 
+    def test_each_run_releases_every_node_once(self):
+        """Repeated runs start from fresh counts and release each cache exactly once."""
+        cache = Toy2Cache()
+        cache.fwd_bnds["Node-1"] = ("input bounds",)
+        arguments = Toy2Argument()
+        nodes = [_ClearCountingNode(f"Node-{i}", cache, arguments) for i in range(1, 4)]
+        for i in range(len(nodes) - 1):
+            nodes[i].next_nodes = [nodes[i + 1]]
+            nodes[i + 1].pre_nodes = [nodes[i]]
+        model = Toy2Model(nodes, clear_cache_during_running=True)
+        model.run()
+        model.run()
+        assert [node.n_cleared for node in nodes] == [2, 2, 2]
+
+    def test_duplicate_nodes_are_decremented_once(self):
+        """``clear_bwd_cache_t2`` counts a node listed twice (x * x) only once."""
+        cache = Toy2Cache()
+        arguments = Toy2Argument()
+        x = _ClearCountingNode("x", cache, arguments)
+        y = _ClearCountingNode("y", cache, arguments)
+        cache_counter = {x: 1, y: 2}
+        clear_bwd_cache_t2(cache_counter, [x, x, y])
+        assert (x.n_cleared, y.n_cleared) == (1, 0)
+        assert cache_counter == {y: 1}
+
 
 class TestGraphReversalFlag:
     """Graph-reversal book-keeping is exposed on the model."""
@@ -9,9 +9,10 @@
 
 import pytest
 
-from propdag import Toy2Model
+from propdag import Toy2Argument, Toy2Cache, Toy2Model
 from test_template2._helpers import (
     build_chain_model_t2,
+    build_chain_nodes_t2,
     build_diamond_model_t2,
     build_invalid_io_nodes_t2,
 )
@@ -48,14 +49,14 @@ def test_cycle_is_detected(self, scenario):
 class TestBFSAndDFSErrorDetection:
     """Both BFS and DFS detect the same constraint violations."""
 
-    @pytest.mark.parametrize("sort_strategy", ["bfs", "dfs"])
+    @pytest.mark.parametrize("sort_strategy", ["bfs", "dfs", "hybrid"])
     def test_both_strategies_detect_multiple_inputs(self, sort_strategy):
         """Multi-input DAGs are rejected under both BFS and DFS."""
         nodes = build_invalid_io_nodes_t2("multi_input")
         with pytest.raises(ValueError, match=r"exactly one input"):
             Toy2Model(nodes, sort_strategy=sort_strategy)
 
-    @pytest.mark.parametrize("sort_strategy", ["bfs", "dfs"])
+    @pytest.mark.parametrize("sort_strategy", ["bfs", "dfs", "hybrid"])
     def test_both_strategies_detect_cycles(self, sort_strategy):
         """Cyclic DAGs are rejected under both BFS and DFS."""
         nodes = build_invalid_io_nodes_t2("two_node_cycle")
@@ -63,6 +64,26 @@ def test_both_strategies_detect_cycles(self, sort_strategy):
             Toy2Model(nodes, sort_strategy=sort_strategy)
 
 
+class TestSharedState:
+    """All nodes must hold the very same cache and argument instances."""
+
+    def test_equal_but_distinct_cache_is_rejected(self):
+        """A node with its own (equal) cache object fails the identity check."""
+        _, nodes = build_chain_nodes_t2(3)
+        nodes[2].cache = Toy2Cache(fwd_bnds=dict(nodes[0].cache.fwd_bnds))
+        assert nodes[2].cache == nodes[0].cache
+        with pytest.raises(AssertionError, match="same cache"):
+            Toy2Model(nodes)
+
+    def test_equal_but_distinct_argument_is_rejected(self):
+        """A node with its own (equal) argument object fails the identity check."""
+        _, nodes = build_chain_nodes_t2(3)
+        nodes[1].argument = Toy2Argument()
+        assert nodes[1].argument == nodes[0].argument
+        with pytest.raises(AssertionError, match="same arguments"):
+            Toy2Model(nodes)
+
+
 class TestValidDAGsAccepted:
     """Valid DAGs construct without error."""
 
@@ -13,6 +13,8 @@
 
 __docformat__ = "restructuredtext"
 
+import sys
+
 import pytest
 from _helpers import verify_topological_order
 
@@ -21,10 +23,19 @@
     topo_sort_backward_t2,
     topo_sort_forward_bfs_t2,
     topo_sort_forward_dfs_t2,
+    topo_sort_forward_hybrid_t2,
+)
+from test_template2._helpers import (
+    build_chain_model_t2,
+    build_chain_nodes_t2,
+    build_diamond_model_t2,
 )
-from test_template2._helpers import build_chain_nodes_t2, build_diamond_model_t2
 
-_FORWARD_SORTS_T2 = [topo_sort_forward_bfs_t2, topo_sort_forward_dfs_t2]
+_FORWARD_SORTS_T2 = [
+    topo_sort_forward_bfs_t2,
+    topo_sort_forward_dfs_t2,
+    topo_sort_forward_hybrid_t2,
+]
 
 
 def _build_sort_topology_nodes_t2(topology: str) -> list[Toy2Node]:
@@ -134,7 +145,7 @@ def test_bfs_vs_dfs_may_differ_but_both_valid(self):
         for sort_func in _FORWARD_SORTS_T2:
             verify_topological_order(sort_func(nodes, verbose=False))
 
-    @pytest.mark.parametrize("sort_strategy", ["bfs", "dfs"])
+    @pytest.mark.parametrize("sort_strategy", ["bfs", "dfs", "hybrid"])
     def test_model_works_with_both_sort_strategies(self, sort_strategy):
         """Toy2Model executes under both BFS and DFS on a diamond topology."""
         model, cache, _ = build_diamond_model_t2(sort_strategy=sort_strategy)
@@ -164,6 +175,12 @@ def test_long_chain_maintains_order(self, length):
             for orig, ordered in zip(nodes, sorted_nodes, strict=True):
                 assert orig == ordered
 
+    def test_deep_chain_does_not_hit_recursion_limit(self):
+        """Chains deeper than the recursion limit are sorted iteratively."""
+        _, nodes = build_chain_nodes_t2(sys.getrecursionlimit() + 100)
+        for sort_func in _FORWARD_SORTS_T2:
+            assert sort_func(nodes, verbose=False) == nodes
+
     def test_same_node_multiple_times_as_predecessor(self):
         """Duplicate predecessor entries do not break the topological sort."""
         cache = Toy2Cache()
@@ -185,6 +202,42 @@ def test_same_node_multiple_times_as_predecessor(self):
             assert position["Node-2"] < position["Node-3"]
 
 
+class TestHybridSortT2:
+    """``topo_sort_forward_hybrid_t2`` keeps chains contiguous across branches."""
+
+    def test_chain_runs_before_sibling_branch(self):
+        """A chain is followed to its end before the sibling branch is scheduled."""
+        cache = Toy2Cache()
+        arguments = Toy2Argument()
+        out, a1, a2, a3, b1, inp = (
+            Toy2Node(name, cache, arguments) for name in ("Output", "A1", "A2", "A3", "B1", "Input")
+        )
+        out.next_nodes = [a1, b1]
+        a1.pre_nodes = [out]
+        a1.next_nodes = [a2]
+        a2.pre_nodes = [a1]
+        a2.next_nodes = [a3]
+        a3.pre_nodes = [a2]
+        a3.next_nodes = [inp]
+        b1.pre_nodes = [out]
+        b1.next_nodes = [inp]
+        inp.pre_nodes = [a3, b1]
+        nodes = [out, a1, a2, a3, b1, inp]
+
+        bfs_names = [node.name for node in topo_sort_forward_bfs_t2(nodes)]
+        hybrid_names = [node.name for node in topo_sort_forward_hybrid_t2(nodes)]
+        assert bfs_names == ["Output", "A1", "B1", "A2", "A3", "Input"]
+        assert hybrid_names == ["Output", "A1", "A2", "A3", "B1", "Input"]
+
+    def test_cycle_raises_value_error(self):
+        """A cycle leaves nodes unsorted and is rejected."""
+        _, nodes = build_chain_nodes_t2(3)
+        nodes[1].pre_nodes.append(nodes[2])
+        nodes[2].next_nodes.append(nodes[1])
+        with pytest.raises(ValueError, match="cycle"):
+            topo_sort_forward_hybrid_t2(nodes)
+
+
 class TestBackwardSortT2:
     """COV2: ``topo_sort_backward_t2`` produces valid per-node backward sorts."""
 
@@ -206,3 +259,30 @@ def test_each_value_starts_with_target_and_lists_only_ancestors(self):
             assert ancestor_names == expected_ancestors, (
                 f"backward sort for {target.name} must contain only it plus its ancestors"
             )
+
+    def test_fan_in_matches_dfs_post_order(self):
+        """A fan-in node's sort is the reversed DFS post-order over ``pre_nodes``."""
+        cache = Toy2Cache()
+        arguments = Toy2Argument()
+        x, a, b, out = (Toy2Node(name, cache, arguments) for name in ("x", "a", "b", "out"))
+        x.next_nodes = [a, b]
+        a.pre_nodes = [x]
+        a.next_nodes = [out]
+        b.pre_nodes = [x]
+        b.next_nodes = [out]
+        out.pre_nodes = [a, b]
+        result = topo_sort_backward_t2([x, a, b, out], verbose=False)
+        assert result[out] == [out, b, a, x]
+        assert result[a] == [a, x]
+
+    def test_deep_chain_does_not_hit_recursion_limit(self):
+        """Backward sorts of very deep chains are built without recursion."""
+        _, nodes = build_chain_nodes_t2(sys.getrecursionlimit() + 100)
+        result = topo_sort_backward_t2(nodes, verbose=False)
+        assert result[nodes[-1]] == nodes[::-1]
+
+    def test_model_builds_backward_sorts_eagerly(self):
+        """``T2Model`` fills ``_all_backward_sorts`` for every node at construction."""
+        model, _, _ = build_chain_model_t2(4)
+        expected = topo_sort_backward_t2(model.nodes, verbose=False)
+        assert model._all_backward_sorts == expected  # noqa: SLF001